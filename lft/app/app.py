@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import os
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -25,6 +26,7 @@ class App(ABC):
         self.close()
 
     def start(self):
+        self._set_event_loop_policy()
         self.nodes = self._gen_nodes()
 
         self._connect_nodes()
@@ -34,9 +36,15 @@ class App(ABC):
         self._run_forever(self.nodes)
 
     def _connect_nodes(self):
-        for node in self.nodes:
-            for peer in (peer for peer in self.nodes if peer != node):
-                node.register_peer(peer)
+        for i, node in enumerate(self.nodes):
+            node.register_peers(itertools.chain(self.nodes[:i], self.nodes[i + 1:]))
+
+    def _set_event_loop_policy(self):
+        try:
+            import uvloop
+        except ImportError:
+            return
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     def close(self):
         self.listener.stop()
@@ -61,8 +69,10 @@ class App(ABC):
         finally:
             for node in nodes:
                 node.close()
-            for task in asyncio.Task.all_tasks():
+            tasks = [task for task in asyncio.all_tasks(self.loop) if not task.done()]
+            for task in tasks:
                 task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
             self.loop.run_until_complete(self.loop.shutdown_asyncgens())
             self.loop.close()
 
@@ -82,8 +92,7 @@ class App(ABC):
         data_pool = [genesis_data]
         vote_pool = []
         epoch_pool = [RotateEpoch(0, []), RotateEpoch(1, tuple(node.node_id for node in nodes))]
-        event = InitializeEvent(genesis_data.prev_id, epoch_pool, data_pool, vote_pool)
-        event.deterministic = False
+        event = InitializeEvent(genesis_data.prev_id, epoch_pool, data_pool, vote_pool, deterministic=False)
         init_node.event_system.simulator.raise_event(event)
 
 
@@ -109,11 +118,12 @@ class RecordApp(App):
         self.path = path
 
     def _start(self, nodes: List[Node]):
+        base_path = str(self.path)
         for node in nodes:
-            node_path = self.path.joinpath(node.node_id.hex())
-            node_path.mkdir()
+            node_path = os.path.join(base_path, node.node_id.hex())
+            os.mkdir(node_path)
 
-            record_io = open(str(node_path.joinpath(RECORD_PATH)), 'w')
+            record_io = open(os.path.join(node_path, RECORD_PATH), 'w', buffering=1 << 16)
             node.start_record(record_io, blocking=False)
 
             self._raise_init_event(node, nodes)
@@ -136,9 +146,10 @@ class ReplayApp(App):
         return [Path(path) for path in os.listdir(str(self.path))]
 
     def _start(self, nodes: List[Node]):
+        base_path = str(self.path)
         for node in nodes:
-            node_path = self.path.joinpath(node.node_id.hex())
-            record_io = open(str(node_path.joinpath(RECORD_PATH)), 'r')
+            record_path = os.path.join(base_path, node.node_id.hex(), RECORD_PATH)
+            record_io = open(record_path, 'r')
 
             node.start_replay(record_io, blocking=False)
 
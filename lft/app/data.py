@@ -9,6 +9,8 @@ T = TypeVar("T")
 
 
 class DefaultData(Data):
+    __slots__ = ("_id", "_prev_id", "_proposer_id", "_number", "_epoch_num", "_round_num", "_prev_votes")
+
     NoneData = bytes(16)
     LazyData = bytes([255] * 16)
 
@@ -109,9 +111,9 @@ class DefaultDataFactory(DataFactory):
                    epoch_num: int,
                    round_num: int,
                    prev_votes: Sequence['DefaultVote']) -> bytes:
-        source = (prev_id + propose_id + data_number.to_bytes(64, 'big') +
-                  epoch_num.to_bytes(64, 'big') + round_num.to_bytes(64, 'big') +
-                  b"".join(prev_vote.id if prev_vote else bytes(16) for prev_vote in prev_votes))
+        source = b"".join((prev_id, propose_id, data_number.to_bytes(64, 'big'),
+                           epoch_num.to_bytes(64, 'big'), round_num.to_bytes(64, 'big'),
+                           *(prev_vote.id if prev_vote else bytes(16) for prev_vote in prev_votes)))
         return sha3_256(source).digest()[:16]
 
     async def create_data(self,
@@ -1,4 +1,3 @@
-import math
 from typing import Sequence, Type
 
 from lft.consensus.messages.data import Data
@@ -14,7 +13,9 @@ class RotateEpoch(Epoch):
         self._num = num
         self._rotate_bound = rotate_bound
         self._voters = tuple(voters)
+        self._voters_set = frozenset(self._voters)
         self._voters_num = len(self._voters)
+        self._quorum_num = self._voters_num - (self._voters_num - 1) // 3 if self._voters_num else 0
 
     @property
     def voters(self) -> Sequence[bytes]:
@@ -30,7 +31,7 @@ class RotateEpoch(Epoch):
 
     @property
     def quorum_num(self) -> int:
-        return math.ceil(self.voters_num * 0.67)
+        return self._quorum_num
 
     def verify_data(self, data: Data):
         self.verify_proposer(data.proposer_id, data.round_num)
@@ -50,14 +51,16 @@ class RotateEpoch(Epoch):
             if voter != expected:
                 raise InvalidVoter(voter, expected)
         else:
-            if voter not in self._voters:
+            if voter not in self._voters_set:
                 raise InvalidVoter(voter, bytes(0))
 
     def get_proposer_id(self, round_num: int) -> bytes:
-        if len(self._voters) == 0:
+        if self._voters_num == 0:
             return b''
+        elif self._rotate_bound == 1:
+            return self._voters[round_num % self._voters_num]
         else:
-            return self._voters[round_num // self._rotate_bound % len(self._voters)]
+            return self._voters[round_num // self._rotate_bound % self._voters_num]
 
     def get_voter_id(self, vote_index: int):
         return self._voters[vote_index]
@@ -1,6 +1,6 @@
 import random
 
-from typing import TYPE_CHECKING, DefaultDict, Set
+from typing import TYPE_CHECKING, DefaultDict, Iterable, Set
 from lft.event import EventRegister, EventSystem
 from lft.event.mediators import DelayedEventMediator
 from lft.consensus.events import (BroadcastDataEvent, BroadcastVoteEvent,
@@ -25,19 +25,20 @@ class Network(EventRegister):
     def add_peer(self, peer: 'Network'):
         self._peers.add(peer)
 
+    def add_peers(self, peers: Iterable['Network']):
+        self._peers.update(peers)
+
     def remove_peer(self, peer: 'Network'):
         self._peers.remove(peer)
 
     def receive_data(self, data: 'Data'):
-        event = ReceiveDataEvent(data)
-        event.deterministic = False
+        event = ReceiveDataEvent(data, deterministic=False)
 
         delay = self.random_delay()
         self._delayed_mediator.execute(delay, event)
 
     def receive_vote(self, vote: 'Vote'):
-        event = ReceiveVoteEvent(vote)
-        event.deterministic = False
+        event = ReceiveVoteEvent(vote, deterministic=False)
 
         delay = self.random_delay()
         self._delayed_mediator.execute(delay, event)
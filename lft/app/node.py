@@ -1,4 +1,4 @@
-from typing import IO, Dict, Type, OrderedDict
+from typing import IO, Dict, Iterable, Type, OrderedDict
 from lft.app.data import DefaultDataFactory
 from lft.app.epoch import RotateEpoch
 from lft.app.vote import DefaultVoteFactory
@@ -54,9 +54,9 @@ class Node:
     async def _start_new_round(self):
         round_start_event = RoundStartEvent(
             epoch=RotateEpoch(1, self._nodes),
-            round_num=self._round_num
+            round_num=self._round_num,
+            deterministic=False
         )
-        round_start_event.deterministic = False
         mediator = self.event_system.get_mediator(DelayedEventMediator)
         mediator.execute(0.5, round_start_event)
 
@@ -88,5 +88,8 @@ class Node:
     def register_peer(self, peer: 'Node'):
         self._network.add_peer(peer._network)
 
+    def register_peers(self, peers: Iterable['Node']):
+        self._network.add_peers(peer._network for peer in peers)
+
     def unregister_peer(self, peer: 'Node'):
         self._network.remove_peer(peer._network)
@@ -41,10 +41,12 @@ class Console:
         old_handlers = executor.handlers
         executor.handlers = set()
 
+        batch = []
         for old_handler in old_handlers:
             old_handler.timer_handler.cancel()
             diff = old_handler.timer_handler.when() - start_time
-            mediator.execute(diff, old_handler.event)
+            batch.extend((diff, event) for event in old_handler.events)
+        mediator.execute_many(batch)
 
 
 def debug_patch(node: 'Node'):
@@ -47,14 +47,14 @@ class Listener:
             self._prompt_app = None
 
     def _handle(self, event: KeyPressEvent):
-        async def _put_threadsafe():
-            try:
-                key = event.key_sequence[0].key
-                self._queue.put_nowait(key)
-            except asyncio.QueueFull:
-                pass
+        key = event.key_sequence[0].key
+        self._loop.call_soon_threadsafe(self._try_put, key)
 
-        asyncio.run_coroutine_threadsafe(_put_threadsafe(), self._loop)
+    def _try_put(self, key):
+        try:
+            self._queue.put_nowait(key)
+        except asyncio.QueueFull:
+            pass
 
     def _exit(self, event: KeyPressEvent):
         self.stop()
@@ -72,18 +72,9 @@ class Listener:
 
 
 class Handler:
-    def __init__(self):
-        self._handlers = {
-            Keys.Escape: self._handle_run_ipython
-        }
-
     async def handle(self, key, app: 'App'):
-        try:
-            handler = self._handlers[key]
-        except KeyError:
-            pass
-        else:
-            await handler(app)
+        if key == Keys.Escape:
+            await self._handle_run_ipython(app)
 
     async def _handle_run_ipython(self, app: 'App'):
         Console().run(app)
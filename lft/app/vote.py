@@ -8,6 +8,8 @@ T = TypeVar("T")
 
 
 class DefaultVote(Vote):
+    __slots__ = ("_id", "_data_id", "_commit_id", "_voter_id", "_epoch_num", "_round_num")
+
     NoneVote = bytes(16)
     LazyVote = bytes([255] * 16)
 
@@ -89,7 +91,7 @@ class DefaultVoteFactory(VoteFactory):
 
     def _create_id(self,
                    data_id: bytes, commit_id: bytes, voter_id: bytes, epoch_num: int, round_num: int) -> bytes:
-        source = data_id + commit_id + voter_id + epoch_num.to_bytes(64, 'big') + round_num.to_bytes(64, 'big')
+        source = b"".join((data_id, commit_id, voter_id, epoch_num.to_bytes(64, 'big'), round_num.to_bytes(64, 'big')))
         return sha3_256(source).digest()[:16]
 
     async def create_vote(self,
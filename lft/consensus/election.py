@@ -119,14 +119,15 @@ class Election:
         self._event_system.simulator.raise_event(round_end)
 
     async def _new_unreal_datums(self):
+        expected_proposer = self._epoch.get_proposer_id(self._round_num)
         none_data = self._data_factory.create_none_data(epoch_num=self._epoch.num,
                                                         round_num=self._round_num,
-                                                        proposer_id=self._epoch.get_proposer_id(self._round_num))
+                                                        proposer_id=expected_proposer)
         self._messages.add_data(none_data)
 
         lazy_data = self._data_factory.create_lazy_data(epoch_num=self._epoch.num,
                                                         round_num=self._round_num,
-                                                        proposer_id=self._epoch.get_proposer_id(self._round_num))
+                                                        proposer_id=expected_proposer)
         self._messages.add_data(lazy_data)
 
     async def _new_real_data_if_proposer(self):
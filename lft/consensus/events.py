@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Sequence, Optional
 
 from lft.consensus.epoch import Epoch
@@ -15,16 +15,19 @@ class InitializeEvent(Event):
     epoch_pool: Sequence['Epoch']
     data_pool: Sequence['Data']
     vote_pool: Sequence['Vote']
+    deterministic: bool = field(default=True, compare=False, repr=False)
 
 
 @dataclass
 class ReceiveDataEvent(Event):
     data: 'Data'
+    deterministic: bool = field(default=True, compare=False, repr=False)
 
 
 @dataclass
 class ReceiveVoteEvent(Event):
     vote: 'Vote'
+    deterministic: bool = field(default=True, compare=False, repr=False)
 
 
 @dataclass
@@ -41,6 +44,7 @@ class BroadcastVoteEvent(Event):
 class RoundStartEvent(Event):
     epoch: Epoch
     round_num: int
+    deterministic: bool = field(default=True, compare=False, repr=False)
 
 
 @dataclass
@@ -8,6 +8,8 @@ __all__ = ("Data", "DataFactory", "DataPool", "DataVerifier")
 
 
 class Data(Message):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def number(self) -> int:
@@ -22,6 +22,8 @@ __all__ = ("Message", "MessagePool")
 
 
 class Message(Serializable):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> bytes:
@@ -7,6 +7,8 @@ __all__ = ("Vote", "VoteFactory", "VotePool", "VoteVerifier")
 
 
 class Vote(Message):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def data_id(self) -> bytes:
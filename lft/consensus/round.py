@@ -92,18 +92,16 @@ class Round:
         await self._raise_lazy_votes_if_available()
 
     async def _raise_receive_data(self, delay: float, data: Data):
-        event = ReceiveDataEvent(data)
-        event.deterministic = False
+        event = ReceiveDataEvent(data, deterministic=False)
 
         mediator = self._event_system.get_mediator(DelayedEventMediator)
         mediator.execute(delay, event)
 
-    async def _raise_receive_vote(self, delay: float, vote: Vote):
-        event = ReceiveVoteEvent(vote)
-        event.deterministic = False
+    async def _raise_receive_votes(self, delay: float, votes: Sequence[Vote]):
+        events = [ReceiveVoteEvent(vote, deterministic=False) for vote in votes]
 
         mediator = self._event_system.get_mediator(DelayedEventMediator)
-        mediator.execute(delay, event)
+        mediator.execute_batch(delay, events)
 
     async def _raise_lazy_votes_if_available(self):
         if self._vote_timeout_started:
@@ -114,18 +112,18 @@ class Round:
             return
 
         self._vote_timeout_started = True
-        for voter in self._epoch.get_voters_id():
-            vote = self._vote_factory.create_lazy_vote(voter, self._epoch.num, self._num)
-            await self._raise_receive_vote(delay=TIMEOUT_VOTE, vote=vote)
+        lazy_votes = [self._vote_factory.create_lazy_vote(voter, self._epoch.num, self._num)
+                      for voter in self._epoch.get_voters_id()]
+        await self._raise_receive_votes(delay=TIMEOUT_VOTE, votes=lazy_votes)
 
     async def _new_unreal_datums(self):
+        expected_proposer = self._epoch.get_proposer_id(self._num)
         none_data = self._data_factory.create_none_data(epoch_num=self._epoch.num,
                                                         round_num=self._num,
-                                                        proposer_id=self._epoch.get_proposer_id(self._num))
+                                                        proposer_id=expected_proposer)
         # NoneData must be received before RoundStart
         await self._receive_data(none_data)
 
-        expected_proposer = self._epoch.get_proposer_id(self._num)
         lazy_data = self._data_factory.create_lazy_data(self._epoch.num,
                                                         self._num,
                                                         expected_proposer)
@@ -141,19 +139,27 @@ class Round:
             await self._election.receive_vote(vote)
 
     def _verify_acceptable_data(self, data: Data):
-        if self._epoch.num != data.epoch_num:
-            raise InvalidEpoch(data.epoch_num, self._epoch.num)
-        if self._num != data.round_num:
-            raise InvalidRound(data.epoch_num, data.round_num, self._epoch.num, self._num)
-        if data in self._messages:
+        epoch_num = self._epoch.num
+        data_epoch_num = data.epoch_num
+        if epoch_num != data_epoch_num:
+            raise InvalidEpoch(data_epoch_num, epoch_num)
+        round_num = self._num
+        data_round_num = data.round_num
+        if round_num != data_round_num:
+            raise InvalidRound(data_epoch_num, data_round_num, epoch_num, round_num)
+        if self._messages.has_data(data.id):
             raise AlreadyProposed(data.id, data.proposer_id)
 
     def _verify_acceptable_vote(self, vote: Vote):
-        if self._epoch.num != vote.epoch_num:
-            raise InvalidEpoch(vote.epoch_num, self._epoch.num)
-        if self._num != vote.round_num:
-            raise InvalidRound(vote.epoch_num, vote.round_num, self._epoch.num, self._num)
-        if vote in self._messages:
+        epoch_num = self._epoch.num
+        vote_epoch_num = vote.epoch_num
+        if epoch_num != vote_epoch_num:
+            raise InvalidEpoch(vote_epoch_num, epoch_num)
+        round_num = self._num
+        vote_round_num = vote.round_num
+        if round_num != vote_round_num:
+            raise InvalidRound(vote_epoch_num, vote_round_num, epoch_num, round_num)
+        if self._messages.has_vote(vote.id):
             raise AlreadyVoted(vote.id, vote.voter_id)
 
     def is_newer_than(self, epoch_num: int, round_num: int):
@@ -194,6 +200,7 @@ class RoundMessages:
 
         self._voters = set()
         self._voters_by_data_id = DefaultDict(set)
+        self._max_voters_num_by_data_id = 0
 
     @property
     def datums(self):
@@ -209,27 +216,40 @@ class RoundMessages:
     def get_data(self, data_id: bytes, default=None):
         return self._datums.get(data_id, default)
 
+    def has_data(self, data_id: bytes):
+        return data_id in self._datums
+
     def add_vote(self, vote: Vote):
-        self._votes[vote.id] = vote
-        self._votes_by_data_id[vote.data_id][vote.id] = vote
+        vote_id = vote.id
+        data_id = vote.data_id
+        voter_id = vote.voter_id
+
+        self._votes[vote_id] = vote
+        self._votes_by_data_id[data_id][vote_id] = vote
 
-        self._voters.add(vote.voter_id)
-        self._voters_by_data_id[vote.data_id].add(vote.voter_id)
+        self._voters.add(voter_id)
+        voters = self._voters_by_data_id[data_id]
+        voters.add(voter_id)
+        if len(voters) > self._max_voters_num_by_data_id:
+            self._max_voters_num_by_data_id = len(voters)
 
     def get_votes(self, data_id: bytes):
         return self._votes_by_data_id[data_id]
 
+    def has_vote(self, vote_id: bytes):
+        return vote_id in self._votes
+
     def reach_quorum(self, quorum: int):
         return len(self._voters) >= quorum
 
     def reach_quorum_consensus(self, quorum: int):
-        return any(len(voters) >= quorum for voters in self._voters_by_data_id.values())
+        return self._max_voters_num_by_data_id >= quorum
 
     def __contains__(self, item: Union[Data, Vote]):
         if isinstance(item, Data):
-            return item.id in self._datums
+            return self.has_data(item.id)
         if isinstance(item, Vote):
-            return item.id in self._votes
+            return self.has_vote(item.id)
         return False
 
 
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Set, Optional
+from typing import Set, Optional, Iterable, Tuple, Sequence
 from lft.event import (Event, EventSimulator, EventMediator,
                        EventInstantMediatorExecutor, EventReplayerMediatorExecutor, EventRecorderMediatorExecutor)
 
@@ -16,13 +16,43 @@ class DelayedHandlerMixin:
                 delay: float,
                 event: Event,
                 event_simulator: EventSimulator):
+        self._handle_batch(loop, delay, (event, ), event_simulator)
+
+    def _handle_batch(self,
+                      loop: asyncio.AbstractEventLoop,
+                      delay: float,
+                      events: Iterable[Event],
+                      event_simulator: EventSimulator):
+        events = tuple(events)
+        _is_valid_events(events)
+
+        loop = loop or asyncio.get_event_loop()
+        self._schedule(loop, loop.time() + delay, events, event_simulator)
+
+    def _handle_many(self,
+                     loop: asyncio.AbstractEventLoop,
+                     items: Iterable[Tuple[float, Event]],
+                     event_simulator: EventSimulator):
+        items = list(items)
+        _is_valid_events(event for _, event in items)
+
+        # Each event still gets its own timer. Only loop.time() is read once for the whole batch.
+        loop = loop or asyncio.get_event_loop()
+        now = loop.time()
+        for delay, event in items:
+            self._schedule(loop, now + delay, (event, ), event_simulator)
+
+    def _schedule(self,
+                  loop: asyncio.AbstractEventLoop,
+                  when: float,
+                  events: Sequence[Event],
+                  event_simulator: EventSimulator):
         delayed_handler = DelayedHandler()
         self.handlers.add(delayed_handler)
 
-        loop = loop or asyncio.get_event_loop()
-        timer_handler = loop.call_later(delay, delayed_handler)
+        timer_handler = loop.call_at(when, delayed_handler)
 
-        delayed_handler.event = event
+        delayed_handler.events = events
         delayed_handler.event_simulator = event_simulator
         delayed_handler.timer_handler = timer_handler
         delayed_handler.handlers = self.handlers
@@ -30,21 +60,31 @@ class DelayedHandlerMixin:
 
 class DelayedEventInstantMediatorExecutor(EventInstantMediatorExecutor, DelayedHandlerMixin):
     def execute(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
-        _is_valid_event(event)
         self._handle(loop, delay, event, self._event_simulator)
 
     async def execute_async(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         return self.execute(delay, event, loop)
 
+    def execute_many(self, items: Iterable[Tuple[float, Event]], loop: asyncio.AbstractEventLoop=None):
+        self._handle_many(loop, items, self._event_simulator)
+
+    def execute_batch(self, delay: float, events: Iterable[Event], loop: asyncio.AbstractEventLoop=None):
+        self._handle_batch(loop, delay, events, self._event_simulator)
+
 
 class DelayedEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, DelayedHandlerMixin):
     def execute(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
-        _is_valid_event(event)
         self._handle(loop, delay, event, self._event_recorder.event_simulator)
 
     async def execute_async(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         return self.execute(delay, event, loop)
 
+    def execute_many(self, items: Iterable[Tuple[float, Event]], loop: asyncio.AbstractEventLoop=None):
+        self._handle_many(loop, items, self._event_recorder.event_simulator)
+
+    def execute_batch(self, delay: float, events: Iterable[Event], loop: asyncio.AbstractEventLoop=None):
+        self._handle_batch(loop, delay, events, self._event_recorder.event_simulator)
+
 
 class DelayedEventReplayerMediatorExecutor(EventReplayerMediatorExecutor):
     def execute(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
@@ -54,6 +94,14 @@ class DelayedEventReplayerMediatorExecutor(EventReplayerMediatorExecutor):
     async def execute_async(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         return self.execute(delay, event, loop)
 
+    def execute_many(self, items: Iterable[Tuple[float, Event]], loop: asyncio.AbstractEventLoop=None):
+        # do nothing
+        _is_valid_events(event for _, event in items)
+
+    def execute_batch(self, delay: float, events: Iterable[Event], loop: asyncio.AbstractEventLoop=None):
+        # do nothing
+        _is_valid_events(events)
+
 
 class DelayedEventMediator(EventMediator):
     InstantExecutorType = DelayedEventInstantMediatorExecutor
@@ -63,20 +111,32 @@ class DelayedEventMediator(EventMediator):
     def execute(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         return super().execute(delay=delay, event=event, loop=loop)
 
+    def execute_many(self, items: Iterable[Tuple[float, Event]], loop: asyncio.AbstractEventLoop=None):
+        return self._executor.execute_many(items=items, loop=loop)
+
+    def execute_batch(self, delay: float, events: Iterable[Event], loop: asyncio.AbstractEventLoop=None):
+        return self._executor.execute_batch(delay=delay, events=events, loop=loop)
+
 
 def _is_valid_event(event: Event):
     if event.deterministic:
         raise RuntimeError(f"Delayed event must not be deterministic :{event.serialize()}")
 
 
+def _is_valid_events(events: Iterable[Event]):
+    for event in events:
+        _is_valid_event(event)
+
+
 class DelayedHandler:
     def __init__(self):
-        self.event: Optional[Event] = None
+        self.events: Sequence[Event] = ()
         self.event_simulator: Optional[EventSimulator] = None
         self.timer_handler: Optional[asyncio.TimerHandle] = None
         self.handlers: Optional[Set['DelayedHandler']] = None
 
     def __call__(self):
         self.handlers.remove(self)
-        self.event_simulator.raise_event(self.event)
+        for event in self.events:
+            self.event_simulator.raise_event(event)
 
@@ -19,6 +19,8 @@ class SerializableMeta(ABCMeta):
 
 
 class Serializable(metaclass=SerializableMeta):
+    __slots__ = ()
+
     def serialize(self) -> dict:
         return {
             "!type": get_type_name(self.__class__),
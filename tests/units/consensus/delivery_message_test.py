@@ -1,3 +1,4 @@
+import asyncio
 from typing import Tuple, List
 
 import pytest
@@ -49,8 +50,8 @@ async def create_sample_items_by_index(index: int, vote_factories: List[VoteFact
     if index == 0:
         prev_votes = []
     else:
-        prev_votes = [await vote_factory.create_vote(prev_id, commit_id, 1, index-1)
-                      for vote_factory in vote_factories]
+        prev_votes = await asyncio.gather(*(vote_factory.create_vote(prev_id, commit_id, 1, index-1)
+                                            for vote_factory in vote_factories))
 
     data = DefaultData(
         id_=data_id,
@@ -61,6 +62,7 @@ async def create_sample_items_by_index(index: int, vote_factories: List[VoteFact
         round_num=index,
         prev_votes=prev_votes
     )
-    votes = [await vote_factory.create_vote(data_id, prev_id, 1, index) for vote_factory in vote_factories]
+    votes = await asyncio.gather(*(vote_factory.create_vote(data_id, prev_id, 1, index)
+                                   for vote_factory in vote_factories))
 
     return data, votes
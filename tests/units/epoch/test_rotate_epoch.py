@@ -1,6 +1,7 @@
 import pytest
 from typing import Sequence
 from lft.app.epoch import RotateEpoch
+from lft.consensus.exceptions import InvalidVoter
 from lft.consensus.messages.data import Data
 from lft.consensus.messages.vote import Vote
 
@@ -52,3 +53,21 @@ def test_rotate_epoch(round_num, rotate_epoch, leader_num):
     epoch = RotateEpoch(0, rotate_bound=rotate_epoch, voters=validators)
     consensus_data_mock = MockData(leader=validators[leader_num], round_=round_num)
     epoch.verify_data(consensus_data_mock)
+
+
+@pytest.mark.parametrize("voters_num,quorum_num", [(0, 0), (1, 1), (3, 3), (4, 3), (7, 5), (10, 7), (21, 15),
+                                                       (100, 67), (103, 69), (301, 201)])
+def test_rotate_epoch_quorum_num(voters_num, quorum_num):
+    validators = [i.to_bytes(2, "big") for i in range(voters_num)]
+    epoch = RotateEpoch(0, voters=validators)
+    assert epoch.quorum_num == quorum_num
+
+
+def test_rotate_epoch_verify_voter():
+    validators = [b'0', b'1', b'2', b'3']
+    epoch = RotateEpoch(0, voters=validators)
+    for validator in validators:
+        epoch.verify_voter(validator)
+
+    with pytest.raises(InvalidVoter):
+        epoch.verify_voter(b'4')
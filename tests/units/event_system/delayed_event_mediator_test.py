@@ -0,0 +1,68 @@
+from lft.event import EventSystem, Event
+from lft.event.mediators import DelayedEventMediator
+
+
+def test_delayed_event_mediator_execute_many():
+    results = []
+
+    event_system = EventSystem()
+    event_system.set_mediator(DelayedEventMediator)
+    event_system.simulator.register_handler(Event1, lambda e: on_event(e, results, event_system))
+    event_system.simulator.register_handler(Event2, lambda e: on_event(e, results, event_system))
+    event_system.simulator.register_handler(Event3, lambda e: on_event(e, results, event_system))
+
+    events = [Event3(), Event1(), Event2()]
+    for event in events:
+        event.deterministic = False
+
+    mediator = event_system.get_mediator(DelayedEventMediator)
+    mediator.switch_instant(event_system.simulator)
+    mediator.execute_many([(0.03, events[0]), (0.01, events[1]), (0.02, events[2])])
+    assert len(mediator._executor.handlers) == 3
+
+    event_system.simulator.start()
+
+    assert results == [1, 2, 3]
+    assert not mediator._executor.handlers
+
+
+def test_delayed_event_mediator_execute_batch():
+    results = []
+
+    event_system = EventSystem()
+    event_system.set_mediator(DelayedEventMediator)
+    event_system.simulator.register_handler(Event1, lambda e: on_event(e, results, event_system))
+    event_system.simulator.register_handler(Event2, lambda e: on_event(e, results, event_system))
+    event_system.simulator.register_handler(Event3, lambda e: on_event(e, results, event_system))
+
+    events = [Event1(), Event2(), Event3()]
+    for event in events:
+        event.deterministic = False
+
+    mediator = event_system.get_mediator(DelayedEventMediator)
+    mediator.switch_instant(event_system.simulator)
+    mediator.execute_batch(0.01, events)
+    assert len(mediator._executor.handlers) == 1
+
+    event_system.simulator.start()
+
+    assert results == [1, 2, 3]
+    assert not mediator._executor.handlers
+
+
+class Event1(Event):
+    value = 1
+
+
+class Event2(Event):
+    value = 2
+
+
+class Event3(Event):
+    value = 3
+
+
+def on_event(event: Event, results: list, event_system: EventSystem):
+    results.append(event.value)
+    if isinstance(event, Event3):
+        event_system.simulator.stop()
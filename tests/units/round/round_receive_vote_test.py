@@ -115,23 +115,27 @@ async def test_round_reach_quorum(voter_num: int):
             await round_.receive_vote(vote)
 
         mediator.execute.assert_not_called()
+        mediator.execute_batch.assert_not_called()
 
         none_vote = quorum_vote_factories[-1].create_none_vote(epoch.num, round_num)
         await round_.receive_vote(none_vote)
 
-        assert len(mediator.execute.call_args_list) == len(voters)
+        mediator.execute.assert_not_called()
+        mediator.execute_batch.assert_called_once()
 
-        for voter, call_args in zip(voters, mediator.execute.call_args_list):
-            timeout, event = call_args[0]
-            assert timeout == TIMEOUT_VOTE
+        timeout, events = mediator.execute_batch.call_args_list[0][0]
+        assert timeout == TIMEOUT_VOTE
+        assert len(events) == len(voters)
+        for event in events:
             assert isinstance(event, ReceiveVoteEvent)
             assert event.vote.is_lazy()
-        mediator.execute.reset_mock()
+        mediator.execute_batch.reset_mock()
 
         none_vote = vote_factories[-1].create_none_vote(epoch.num, round_num)
         await round_.receive_vote(none_vote)
 
         mediator.execute.assert_not_called()
+        mediator.execute_batch.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -163,3 +167,4 @@ async def test_round_reach_quorum_consensus(voter_num: int):
             await round_.receive_vote(vote)
 
         mediator.execute.assert_not_called()
+        mediator.execute_batch.assert_not_called()
@@ -17,6 +17,8 @@ def test_data():
     assert round_messages.get_data(os.urandom(16), default="default") == "default"
 
     assert data in round_messages
+    assert round_messages.has_data(data.id)
+    assert not round_messages.has_data(os.urandom(16))
     assert not (_random_data() in round_messages)
     assert data.id not in round_messages
     assert not(data.id in round_messages)
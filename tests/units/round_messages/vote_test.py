@@ -16,6 +16,8 @@ def test_vote():
     assert vote.id not in round_messages.get_votes(os.urandom(16))
 
     assert vote in round_messages
+    assert round_messages.has_vote(vote.id)
+    assert not round_messages.has_vote(os.urandom(16))
     assert not (_random_vote() in round_messages)
     assert vote.id not in round_messages
     assert not(vote.id in round_messages)